@@ -1,59 +1,379 @@
+import os
+import time
+import pickle
+import hashlib
+import tempfile
+import functools
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
-import yfinance as yf
+import requests
 from datetime import datetime, timedelta
-import utils
+from concurrent.futures import ThreadPoolExecutor
 
-def get_stock_data(ticker, start_date, end_date):
+# Shared HTTP session so Yahoo Finance requests reuse pooled connections
+_SESSION = requests.Session()
+
+# On-disk cache of Yahoo Finance responses, kept across app restarts
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.yf_cache')
+_CACHE_TTL = 3600  # seconds
+
+# Price columns returned by default; 'Adj Close' is not used by the charts
+_PRICE_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# Line items used for placeholder financial statements
+_INCOME_COLS = ('Total Revenue', 'Cost Of Revenue', 'Gross Profit', 'Operating Expense',
+                'Operating Income', 'Net Income')
+_BALANCE_COLS = ('Total Assets', 'Total Liabilities', 'Total Stockholder Equity',
+                 'Cash And Cash Equivalents', 'Short Term Investments', 'Inventory')
+_CASH_COLS = ('Operating Cash Flow', 'Capital Expenditure', 'Free Cash Flow',
+              'Dividend Payout', 'Cash From Financing', 'Cash From Investment')
+
+# Static reference data, shared read-only across calls
+_PRODUCTION_EFFICIENCY_METRICS = MappingProxyType({
+    'production_rate': 12000,           # vehicles per week
+    'production_rate_change': 15,        # % change
+    'factory_utilization': 85,           # %
+    'utilization_change': 5,             # % change
+    'production_cost': 36000,            # $ per vehicle
+    'cost_change': -8                    # % change (negative = improvement)
+})
+
+_SUSTAINABILITY_METRICS = MappingProxyType({
+    'Renewable Energy Use': 85,
+    'Water Recycling': 70,
+    'Waste Reduction': 65,
+    'Battery Recycling': 90,
+    'Carbon Footprint Reduction': 75,
+    'Sustainable Materials': 60
+})
+
+# Market share data (%) by year and manufacturer
+_MARKET_SHARE = MappingProxyType({
+    2018: MappingProxyType({
+        'Tesla': 12,
+        'BAIC': 8,
+        'BYD': 7,
+        'BMW': 6,
+        'Nissan': 6,
+        'Volkswagen': 5,
+        'Hyundai-Kia': 4,
+        'Others': 52
+    }),
+    2019: MappingProxyType({
+        'Tesla': 16,
+        'BAIC': 7,
+        'BYD': 7,
+        'Volkswagen': 7,
+        'BMW': 5,
+        'Nissan': 5,
+        'Hyundai-Kia': 5,
+        'Others': 48
+    }),
+    2020: MappingProxyType({
+        'Tesla': 18,
+        'Volkswagen': 8,
+        'SAIC': 7,
+        'BYD': 6,
+        'BMW': 5,
+        'Hyundai-Kia': 5,
+        'Nissan': 4,
+        'Others': 47
+    }),
+    2021: MappingProxyType({
+        'Tesla': 21,
+        'Volkswagen': 11,
+        'SAIC': 8,
+        'BYD': 7,
+        'Hyundai-Kia': 6,
+        'BMW': 5,
+        'Stellantis': 5,
+        'Others': 37
+    }),
+    2022: MappingProxyType({
+        'Tesla': 23,
+        'BYD': 11,
+        'Volkswagen': 10,
+        'SAIC': 7,
+        'Hyundai-Kia': 7,
+        'Stellantis': 6,
+        'BMW': 5,
+        'Others': 31
+    }),
+    2023: MappingProxyType({
+        'Tesla': 19,
+        'BYD': 17,
+        'Volkswagen': 9,
+        'SAIC': 8,
+        'Hyundai-Kia': 7,
+        'Stellantis': 6,
+        'BMW': 5,
+        'Others': 29
+    })
+})
+
+def _disk_cache(func):
+    """
+    Persist the results of a Yahoo Finance fetch on disk for _CACHE_TTL seconds.
+    
+    Dates in the arguments are keyed by their ISO string so equal dates
+    always hit the same cache file. Empty results are not persisted, since
+    yfinance returns empty frames when a request fails.
+    """
+    @functools.wraps(func)
+    def wrapper(*args):
+        key_parts = [func.__name__] + [arg.isoformat() if hasattr(arg, 'isoformat') else str(arg)
+                                       for arg in args]
+        key = hashlib.sha1('|'.join(key_parts).encode()).hexdigest()
+        path = os.path.join(_CACHE_DIR, f"{key}.pkl")
+        
+        # Return the cached result if it is still fresh. Any failure to read it,
+        # including a pickle written by another pandas version, falls through to a refetch.
+        try:
+            if time.time() - os.path.getmtime(path) < _CACHE_TTL:
+                with open(path, 'rb') as f:
+                    return pickle.load(f)
+        except Exception:
+            pass
+        
+        result = func(*args)
+        
+        if isinstance(result, dict):
+            has_data = any(not df.empty for df in result.values())
+        else:
+            has_data = not result.empty
+        
+        if has_data:
+            tmp_path = None
+            try:
+                os.makedirs(_CACHE_DIR, exist_ok=True)
+                _prune_disk_cache()
+                
+                # Write to a uniquely named temporary file first so readers never see a
+                # partial file and concurrent sessions never share one
+                fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    pickle.dump(result, f)
+                os.replace(tmp_path, path)
+            except (OSError, pickle.PickleError) as e:
+                print(f"Error writing data cache: {e}")
+                if tmp_path is not None:
+                    try:
+                        os.remove(tmp_path)
+                    except OSError:
+                        pass
+        
+        return result
+    
+    return wrapper
+
+def _prune_disk_cache():
+    """
+    Delete cache files older than _CACHE_TTL.
+    
+    Cache keys include the requested end date, which changes every day,
+    so expired entries are never overwritten and must be removed here.
+    """
+    cutoff = time.time() - _CACHE_TTL
+    try:
+        entries = list(os.scandir(_CACHE_DIR))
+    except OSError:
+        return
+    
+    for entry in entries:
+        try:
+            if entry.name.endswith(('.pkl', '.tmp')) and entry.stat().st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            # Another session may have replaced or removed it already
+            pass
+
+def clear_disk_cache():
+    """
+    Delete every cached fetch result so the next call downloads fresh data.
+    
+    In-progress .tmp files are left alone; they belong to writers that are
+    still running and are pruned once they expire.
+    """
+    try:
+        entries = list(os.scandir(_CACHE_DIR))
+    except OSError:
+        return
+    
+    for entry in entries:
+        try:
+            if entry.name.endswith('.pkl'):
+                os.remove(entry.path)
+        except OSError:
+            # Another session may have replaced or removed it already
+            pass
+
+def get_stock_data(ticker, start_date, end_date, columns=_PRICE_COLUMNS):
     """
     Fetch stock data for a given ticker and date range.
     
+    Only the requested columns are kept so cached frames stay small.
+    
     Args:
         ticker (str): Stock ticker symbol
         start_date (datetime): Start date for data
         end_date (datetime): End date for data
+        columns (tuple): Price columns to return
         
     Returns:
         DataFrame: Stock price data
     """
-    # Convert dates to string format for yfinance
-    start_str = start_date.strftime('%Y-%m-%d')
-    end_str = end_date.strftime('%Y-%m-%d')
-    
     # Fetch data from Yahoo Finance
     try:
-        data = yf.download(ticker, start=start_str, end=end_str)
+        data = _download_history(ticker, start_date, end_date)
         if data.empty:
             # If data is empty, return dummy dataframe
-            return pd.DataFrame(index=pd.date_range(start=start_date, end=end_date),
-                               columns=['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume'])
-        return data
+            return _empty_ohlcv(start_date, end_date, columns)
+        return data.reindex(columns=list(columns))
     except Exception as e:
         print(f"Error fetching stock data: {e}")
         # Return empty dataframe in case of error
-        return pd.DataFrame(index=pd.date_range(start=start_date, end=end_date),
-                           columns=['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume'])
+        return _empty_ohlcv(start_date, end_date, columns)
+
+@_disk_cache
+def _download_history(ticker, start_date, end_date):
+    """Download daily price history for a ticker from Yahoo Finance."""
+    # Imported lazily so the static data helpers don't pay for yfinance's import
+    import yfinance as yf
+    
+    return yf.download(ticker, start=start_date, end=end_date, progress=False,
+                       auto_adjust=False, threads=False, session=_SESSION)
+
+def _empty_ohlcv(start_date, end_date, columns=_PRICE_COLUMNS):
+    """Create a placeholder price dataframe when no data could be fetched."""
+    start = pd.Timestamp(start_date).date()
+    end = pd.Timestamp(end_date).date()
+    return _build_empty_ohlcv(start, end, tuple(columns)).copy()
 
-def get_competitor_data(tickers, start_date, end_date):
+@functools.lru_cache(maxsize=32)
+def _build_empty_ohlcv(start, end, columns):
+    """Build the placeholder price dataframe once per date range."""
+    return pd.DataFrame(index=pd.date_range(start=start, end=end), columns=list(columns))
+
+def get_competitor_data(tickers, start_date, end_date, columns=_PRICE_COLUMNS):
     """
     Fetch stock data for multiple competitors.
     
+    All tickers are requested in a single batched download rather than
+    one request per ticker.
+    
     Args:
         tickers (list): List of ticker symbols
         start_date (datetime): Start date for data
         end_date (datetime): End date for data
+        columns (tuple): Price columns to return for each ticker
         
     Returns:
         dict: Dictionary of stock dataframes keyed by ticker
     """
+    tickers = list(tickers)
+    
+    # A single ticker comes back without the per-ticker column level
+    if len(tickers) <= 1:
+        return {ticker: get_stock_data(ticker, start_date, end_date, columns) for ticker in tickers}
+    
+    import yfinance as yf
+    
+    try:
+        raw = yf.download(tickers, start=start_date, end=end_date,
+                          group_by='ticker', threads=True, progress=False,
+                          session=_SESSION)
+    except Exception as e:
+        print(f"Error fetching competitor data: {e}")
+        raw = pd.DataFrame()
+    
     competitor_data = {}
     
     for ticker in tickers:
-        ticker_data = get_stock_data(ticker, start_date, end_date)
-        competitor_data[ticker] = ticker_data
+        if raw.empty or ticker not in raw.columns.get_level_values(0):
+            competitor_data[ticker] = _empty_ohlcv(start_date, end_date, columns)
+            continue
+        
+        # Drop dates on which only the other tickers traded
+        ticker_data = raw[ticker].dropna(how='all')
+        if ticker_data.empty:
+            competitor_data[ticker] = _empty_ohlcv(start_date, end_date, columns)
+        else:
+            competitor_data[ticker] = ticker_data.reindex(columns=list(columns))
     
     return competitor_data
 
+def downsample_positions(values, n_out=2000):
+    """
+    Pick the positions of a series to plot so that its shape is preserved.
+    
+    The series is split into equal buckets and the minimum and maximum of
+    each bucket are kept, along with the first and last points, so peaks and
+    valleys survive while the point count drops to about n_out.
+    
+    Args:
+        values (array-like): Numeric series to thin out
+        n_out (int): Approximate number of points to keep
+        
+    Returns:
+        ndarray: Sorted integer positions into values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    if n <= n_out:
+        return np.arange(n)
+    
+    # Two points (min and max) are kept per bucket
+    bucket_size = -(-n // max(n_out // 2, 1))
+    n_buckets = -(-n // bucket_size)
+    
+    # Pad to a full grid so every bucket can be reduced in one call
+    padded = np.full(n_buckets * bucket_size, np.nan)
+    padded[:n] = values
+    buckets = padded.reshape(n_buckets, bucket_size)
+    missing = np.isnan(buckets)
+    offsets = np.arange(n_buckets) * bucket_size
+    
+    lows = np.where(missing, np.inf, buckets).argmin(axis=1) + offsets
+    highs = np.where(missing, -np.inf, buckets).argmax(axis=1) + offsets
+    
+    positions = np.unique(np.concatenate(([0, n - 1], lows, highs)))
+    return positions[positions < n]
+
+def rolling_means(values, windows=(50, 200)):
+    """
+    Compute trailing moving averages for several window sizes at once.
+    
+    A single prefix sum of the series is shared by every window, so each
+    average costs one vectorized subtraction regardless of its length.
+    Like pandas' rolling mean, a point is NaN until its window holds a full
+    set of non-missing values.
+    
+    Args:
+        values (array-like): Numeric series to average
+        windows (tuple): Window lengths, in points
+        
+    Returns:
+        tuple: One float64 ndarray per window, aligned with values
+    """
+    values = np.asarray(values, dtype=np.float64)
+    n = len(values)
+    valid = ~np.isnan(values)
+    
+    # Leading zero so a window sum is a difference of two prefix entries
+    sums = np.concatenate(([0.0], np.cumsum(np.where(valid, values, 0.0))))
+    counts = np.concatenate(([0], np.cumsum(valid)))
+    
+    means = []
+    for window in windows:
+        out = np.full(n, np.nan)
+        if 0 < window <= n:
+            window_sums = sums[window:] - sums[:-window]
+            window_counts = counts[window:] - counts[:-window]
+            out[window - 1:] = np.where(window_counts == window, window_sums / window, np.nan)
+        means.append(out)
+    return tuple(means)
+
 def get_financial_statements(ticker, period="quarterly"):
     """
     Fetch financial statement data for a company.
@@ -65,18 +385,10 @@ def get_financial_statements(ticker, period="quarterly"):
     Returns:
         dict: Dictionary containing income statement, balance sheet, and cash flow data
     """
-    # Get ticker object
-    ticker_obj = yf.Ticker(ticker)
-    
-    # Determine which financials to fetch
-    if period == "quarterly":
-        income_stmt = ticker_obj.quarterly_financials
-        balance_sheet = ticker_obj.quarterly_balance_sheet
-        cash_flow = ticker_obj.quarterly_cashflow
-    else:  # annual
-        income_stmt = ticker_obj.financials
-        balance_sheet = ticker_obj.balance_sheet
-        cash_flow = ticker_obj.cashflow
+    statements = _fetch_statements(ticker, period)
+    income_stmt = statements["income_statement"]
+    balance_sheet = statements["balance_sheet"]
+    cash_flow = statements["cash_flow"]
     
     # Check if any of the statements are empty and provide appropriate defaults
     if income_stmt.empty:
@@ -94,27 +406,55 @@ def get_financial_statements(ticker, period="quarterly"):
         "cash_flow": cash_flow
     }
 
+@_disk_cache
+def _fetch_statements(ticker, period):
+    """Download the raw income statement, balance sheet, and cash flow from Yahoo Finance."""
+    import yfinance as yf
+    
+    # Get ticker object
+    ticker_obj = yf.Ticker(ticker, session=_SESSION)
+    
+    # Determine which financials to fetch
+    if period == "quarterly":
+        attributes = {
+            "income_statement": "quarterly_financials",
+            "balance_sheet": "quarterly_balance_sheet",
+            "cash_flow": "quarterly_cashflow"
+        }
+    else:  # annual
+        attributes = {
+            "income_statement": "financials",
+            "balance_sheet": "balance_sheet",
+            "cash_flow": "cashflow"
+        }
+    
+    # Each attribute is a separate request, so fetch them concurrently
+    with ThreadPoolExecutor(max_workers=len(attributes)) as executor:
+        futures = {name: executor.submit(getattr, ticker_obj, attr)
+                   for name, attr in attributes.items()}
+        statements = {name: future.result() for name, future in futures.items()}
+    
+    return statements
+
 def create_default_financial_df(period, statement_type):
     """Create a default dataframe for financial statements when data is unavailable."""
     # Create date ranges based on period
     if period == "quarterly":
-        dates = pd.date_range(end=datetime.now(), periods=8, freq='Q')
+        dates = pd.date_range(end=datetime.now(), periods=8, freq='QE')
     else:  # annual
-        dates = pd.date_range(end=datetime.now(), periods=5, freq='Y')
+        dates = pd.date_range(end=datetime.now(), periods=5, freq='YE')
     
     # Define columns based on statement type
     if statement_type == "income":
-        columns = ['Total Revenue', 'Cost Of Revenue', 'Gross Profit', 'Operating Expense',
-                  'Operating Income', 'Net Income']
+        columns = _INCOME_COLS
     elif statement_type == "balance":
-        columns = ['Total Assets', 'Total Liabilities', 'Total Stockholder Equity', 
-                  'Cash And Cash Equivalents', 'Short Term Investments', 'Inventory']
+        columns = _BALANCE_COLS
     else:  # cash
-        columns = ['Operating Cash Flow', 'Capital Expenditure', 'Free Cash Flow',
-                  'Dividend Payout', 'Cash From Financing', 'Cash From Investment']
+        columns = _CASH_COLS
     
-    # Create empty DataFrame with appropriate structure
-    df = pd.DataFrame(0, index=columns, columns=dates)
+    # Create zero-filled DataFrame with appropriate structure from a single allocation
+    values = np.zeros((len(columns), len(dates)), dtype=np.float64)
+    df = pd.DataFrame(values, index=list(columns), columns=dates)
     return df
 
 def calculate_financial_ratios(financials):
@@ -131,55 +471,80 @@ def calculate_financial_ratios(financials):
     income_stmt = financials['income_statement']
     balance_sheet = financials['balance_sheet']
     
-    # Prepare DataFrame for ratios
-    ratios = pd.DataFrame(index=income_stmt.columns)
-    
-    # Calculate Gross Margin (%)
-    try:
-        ratios['Gross Margin'] = (income_stmt.loc['Gross Profit'] / income_stmt.loc['Total Revenue']) * 100
-    except (KeyError, ZeroDivisionError):
-        ratios['Gross Margin'] = np.nan
+    # Pull every row needed in one lookup; missing rows come back as NaN
+    income = income_stmt.reindex(['Total Revenue', 'Gross Profit',
+                                  'Operating Income', 'Net Income']).astype(float)
+    equity = balance_sheet.reindex(['Total Stockholder Equity']).astype(float)
+    equity = equity.iloc[0].reindex(income_stmt.columns)
     
-    # Calculate Operating Margin (%)
-    try:
-        ratios['Operating Margin'] = (income_stmt.loc['Operating Income'] / income_stmt.loc['Total Revenue']) * 100
-    except (KeyError, ZeroDivisionError):
-        ratios['Operating Margin'] = np.nan
+    # Treat zero denominators as missing instead of producing infinities
+    revenue = income.loc['Total Revenue']
+    revenue = revenue.where(revenue != 0)
+    equity = equity.where(equity != 0)
     
-    # Calculate Net Profit Margin (%)
-    try:
-        ratios['Net Profit Margin'] = (income_stmt.loc['Net Income'] / income_stmt.loc['Total Revenue']) * 100
-    except (KeyError, ZeroDivisionError):
-        ratios['Net Profit Margin'] = np.nan
-    
-    # Calculate Return on Equity (%)
-    try:
-        ratios['ROE'] = (income_stmt.loc['Net Income'] / balance_sheet.loc['Total Stockholder Equity']) * 100
-    except (KeyError, ZeroDivisionError):
-        ratios['ROE'] = np.nan
+    # Calculate margins (%) and Return on Equity (%) across all periods at once
+    ratios = income.loc[['Gross Profit', 'Operating Income', 'Net Income']].div(revenue, axis=1) * 100
+    ratios.index = ['Gross Margin', 'Operating Margin', 'Net Profit Margin']
+    ratios.loc['ROE'] = income.loc['Net Income'] / equity * 100
     
     # Fill missing values and return
-    ratios = ratios.fillna(0).T
+    ratios = ratios.fillna(0)
     
     return ratios
 
-def get_tesla_delivery_data():
+def _compound_growth(base, growth_factors):
+    """
+    Build a compounded growth series in one vectorized pass.
+    
+    The first period equals base; each later period is the previous value
+    multiplied by that period's growth factor.
+    
+    Args:
+        base (float): Value of the first period
+        growth_factors (ndarray): Per-period growth multipliers (first entry is ignored)
+        
+    Returns:
+        ndarray: Compounded series with the same length as growth_factors
+    """
+    factors = np.array(growth_factors, dtype=float)
+    factors[0] = 1.0
+    return base * np.cumprod(factors)
+
+def get_delivery_quarter_count():
+    """
+    Get the number of quarters of delivery data available today.
+    
+    Returns:
+        int: Quarters from Q1 2019 to the present
+    """
+    current_date = datetime.now()
+    return (current_date.year - 2019) * 4 + (current_date.month // 3)
+
+def get_tesla_delivery_data(periods=None):
     """
     Get historical Tesla vehicle delivery data.
     
     Since we don't have direct access to Tesla's delivery database,
     we'll create a structured representation of published quarterly deliveries.
     
+    Args:
+        periods (int): Number of quarters to include; defaults to get_delivery_quarter_count()
+        
     Returns:
         DataFrame: Quarterly delivery data with model breakdown
     """
-    # Create quarterly date range from 2019 to present
-    current_date = datetime.now()
-    periods = (current_date.year - 2019) * 4 + (current_date.month // 3)
-    quarters = pd.date_range('2019-03-31', periods=periods, freq='Q')
+    # Number of quarters from 2019 to present
+    if periods is None:
+        periods = get_delivery_quarter_count()
     
-    # Create DataFrame with quarterly structure
-    data = pd.DataFrame(index=quarters)
+    # The data only changes when a quarter is added, so reuse the cached build
+    return _build_delivery_data(periods).copy()
+
+@functools.lru_cache(maxsize=4)
+def _build_delivery_data(periods):
+    """Build the quarterly delivery dataframe for the given number of quarters."""
+    # Create quarterly date range from 2019 to present
+    quarters = pd.date_range('2019-03-31', periods=periods, freq='QE')
     
     # Add total deliveries with a realistic growth trend
     # Starting with ~63k in Q1 2019 and growing to recent levels
@@ -187,48 +552,52 @@ def get_tesla_delivery_data():
     growth_multiplier = 1.1  # 10% quarterly growth on average
     
     # Generate total deliveries with some variability
-    np.random.seed(42)  # For reproducibility
-    growth_factors = np.random.normal(growth_multiplier, 0.05, len(quarters))
+    # A local seeded generator keeps results reproducible without touching global RNG state
+    growth_factors = np.random.default_rng(42).normal(growth_multiplier, 0.05, len(quarters))
     
     # Calculate quarterly deliveries
-    total_deliveries = [base_deliveries]
-    for i in range(1, len(quarters)):
-        next_delivery = total_deliveries[-1] * growth_factors[i]
-        total_deliveries.append(next_delivery)
-    
-    data['Total Deliveries'] = total_deliveries
+    total_deliveries = _compound_growth(base_deliveries, growth_factors)
     
     # Add model breakdown - Model 3/Y and Model S/X
     # Model 3/Y has been growing as a percentage of total over time
     model_3y_pct = np.linspace(0.75, 0.95, len(quarters))  # Increasing percentage
     
-    data['Model 3/Y'] = data['Total Deliveries'] * model_3y_pct
-    data['Model S/X'] = data['Total Deliveries'] - data['Model 3/Y']
+    model_3y = total_deliveries * model_3y_pct
+    model_sx = total_deliveries - model_3y
     
     # Further breakdown Model 3/Y into individual models
     model_3_pct = np.linspace(0.8, 0.45, len(quarters))  # Decreasing as Model Y grows
     
-    data['Model 3'] = data['Model 3/Y'] * model_3_pct
-    data['Model Y'] = data['Model 3/Y'] - data['Model 3']
+    model_3 = model_3y * model_3_pct
+    model_y = model_3y - model_3
     
     # Further breakdown Model S/X into individual models
     model_s_pct = np.linspace(0.6, 0.5, len(quarters))  # Roughly equal split
     
-    data['Model S'] = data['Model S/X'] * model_s_pct
-    data['Model X'] = data['Model S/X'] - data['Model S']
+    model_s = model_sx * model_s_pct
+    model_x = model_sx - model_s
+    
+    # Create DataFrame with quarterly structure from all series at once
+    data = pd.DataFrame(
+        np.column_stack([total_deliveries, model_3y, model_sx, model_3, model_y, model_s, model_x]),
+        index=quarters,
+        columns=['Total Deliveries', 'Model 3/Y', 'Model S/X', 'Model 3', 'Model Y', 'Model S', 'Model X']
+    )
     
     # Add Cybertruck deliveries starting in Q4 2023
-    data['Cybertruck'] = 0
-    if '2023-12-31' in data.index:
-        cybertruck_start_idx = data.index.get_loc(pd.Timestamp('2023-12-31'))
-        # Create a list with the exact length needed
-        cybertruck_values = [2000, 10000, 20000, 30000, 40000, 50000, 60000]  # Add more values to ensure we have enough
-        needed_values = len(data) - cybertruck_start_idx
-        data.iloc[cybertruck_start_idx:, data.columns.get_loc('Cybertruck')] = cybertruck_values[:needed_values]
-    
-    # Convert to integers
-    for col in data.columns:
-        data[col] = data[col].astype(int)
+    cybertruck_values = np.array([2000, 10000, 20000, 30000, 40000, 50000, 60000])
+    launched = data.index >= pd.Timestamp('2023-12-31')
+    needed_values = int(launched.sum())
+    
+    # Hold the last ramp value for quarters beyond the listed ones
+    ramp = np.pad(cybertruck_values, (0, max(needed_values - len(cybertruck_values), 0)), mode='edge')
+    
+    cybertruck = np.zeros(len(data), dtype=np.int64)
+    cybertruck[launched] = ramp[:needed_values]
+    data['Cybertruck'] = cybertruck
+    
+    # Convert to integers in a single cast
+    data = data.astype(np.int64)
     
     return data
 
@@ -241,52 +610,69 @@ def filter_delivery_data(delivery_data, time_period):
         time_period (str): Selected time period ('Last Quarter', 'Last Year', 'All Time')
         
     Returns:
-        DataFrame: Filtered delivery data
+        DataFrame: Filtered delivery data. This is a slice of delivery_data,
+        not a copy, so callers that modify it should copy it first.
     """
     if time_period == "Last Quarter":
-        return delivery_data.iloc[-1:].copy()
+        return delivery_data.iloc[-1:]
     elif time_period == "Last Year":
-        return delivery_data.iloc[-4:].copy()
+        return delivery_data.iloc[-4:]
     else:  # All Time
-        return delivery_data.copy()
+        return delivery_data
 
 def get_production_efficiency_metrics():
     """
     Get production efficiency metrics.
     
     Returns:
-        dict: Production efficiency metrics
+        Mapping: Production efficiency metrics (read-only)
     """
-    # Providing structured efficiency data
-    return {
-        'production_rate': 12000,           # vehicles per week
-        'production_rate_change': 15,        # % change
-        'factory_utilization': 85,           # %
-        'utilization_change': 5,             # % change
-        'production_cost': 36000,            # $ per vehicle
-        'cost_change': -8                    # % change (negative = improvement)
-    }
+    return _PRODUCTION_EFFICIENCY_METRICS
+
+def get_last_environmental_year():
+    """
+    Get the last calendar year included in the environmental impact data.
+    
+    Returns:
+        int: The most recent completed year
+    """
+    # Only completed calendar years are included
+    current_date = datetime.now()
+    return current_date.year if (current_date.month, current_date.day) == (12, 31) else current_date.year - 1
 
-def get_environmental_impact_data():
+def get_environmental_impact_data(last_year=None):
     """
     Get environmental impact data.
     
+    Args:
+        last_year (int): Last year to include; defaults to get_last_environmental_year()
+        
     Returns:
         DataFrame: Environmental impact metrics over time
     """
+    if last_year is None:
+        last_year = get_last_environmental_year()
+    
+    # The data only changes when a year is added, so reuse the cached build
+    return _build_environmental_data(last_year).copy()
+
+@functools.lru_cache(maxsize=4)
+def _build_environmental_data(last_year):
+    """Build the yearly environmental impact dataframe up to the given year."""
     # Create yearly data from 2018 to present
-    years = pd.date_range(start='2018-01-01', end=datetime.now(), freq='Y')
+    years = pd.date_range(start='2018-01-01', end=f'{last_year}-12-31', freq='YE')
     
     # Create DataFrame
     data = pd.DataFrame(index=years)
     
+    # Each series grows at a fixed rate, so use the closed form base * rate**year
+    exponents = np.arange(len(years))
+    
     # Carbon offset (in million metric tons CO2)
     base_offset = 3.5
     growth_rate = 1.4  # 40% annual growth
     
-    carbon_offset = [base_offset]
-    for i in range(1, len(years)):
-        carbon_offset.append(carbon_offset[-1] * growth_rate)
+    carbon_offset = base_offset * growth_rate ** exponents
     
     data['Carbon Offset (Mt CO2)'] = carbon_offset
     
@@ -294,9 +680,7 @@ def get_environmental_impact_data():
     base_solar = 200
     solar_growth = 1.3  # 30% annual growth
     
-    solar_deployment = [base_solar]
-    for i in range(1, len(years)):
-        solar_deployment.append(solar_deployment[-1] * solar_growth)
+    solar_deployment = base_solar * solar_growth ** exponents
     
     data['Solar Deployment (MW)'] = solar_deployment
     
@@ -304,9 +688,7 @@ def get_environmental_impact_data():
     base_storage = 1000
     storage_growth = 1.5  # 50% annual growth
     
-    storage_deployment = [base_storage]
-    for i in range(1, len(years)):
-        storage_deployment.append(storage_deployment[-1] * storage_growth)
+    storage_deployment = base_storage * storage_growth ** exponents
     
     data['Energy Storage (MWh)'] = storage_deployment
     
@@ -314,17 +696,14 @@ def get_environmental_impact_data():
     base_superchargers = 1100
     sc_growth = 1.35  # 35% annual growth
     
-    superchargers = [base_superchargers]
-    for i in range(1, len(years)):
-        superchargers.append(superchargers[-1] * sc_growth)
+    superchargers = base_superchargers * sc_growth ** exponents
     
     data['Supercharger Stations'] = superchargers
     
     # Convert to appropriate data types
+    int_cols = ['Solar Deployment (MW)', 'Energy Storage (MWh)', 'Supercharger Stations']
     data['Carbon Offset (Mt CO2)'] = data['Carbon Offset (Mt CO2)'].round(2)
-    data['Solar Deployment (MW)'] = data['Solar Deployment (MW)'].astype(int)
-    data['Energy Storage (MWh)'] = data['Energy Storage (MWh)'].astype(int)
-    data['Supercharger Stations'] = data['Supercharger Stations'].astype(int)
+    data[int_cols] = data[int_cols].astype(np.int64)
     
     return data
 
@@ -342,18 +721,16 @@ def get_latest_energy_metrics(environmental_data):
     latest_data = environmental_data.iloc[-1]
     prev_data = environmental_data.iloc[-2] if len(environmental_data) > 1 else latest_data
     
-    # Calculate growth rates
-    solar_growth = ((latest_data['Solar Deployment (MW)'] / prev_data['Solar Deployment (MW)']) - 1) * 100
-    storage_growth = ((latest_data['Energy Storage (MWh)'] / prev_data['Energy Storage (MWh)']) - 1) * 100
-    sc_growth = ((latest_data['Supercharger Stations'] / prev_data['Supercharger Stations']) - 1) * 100
+    # Calculate growth rates for every metric in one vectorized division
+    growth = ((latest_data / prev_data - 1) * 100).round()
     
     return {
         'solar_deployment': latest_data['Solar Deployment (MW)'],
-        'solar_growth': round(solar_growth),
+        'solar_growth': int(growth['Solar Deployment (MW)']),
         'storage_deployment': latest_data['Energy Storage (MWh)'],
-        'storage_growth': round(storage_growth),
+        'storage_growth': int(growth['Energy Storage (MWh)']),
         'superchargers': latest_data['Supercharger Stations'],
-        'supercharger_growth': round(sc_growth)
+        'supercharger_growth': int(growth['Supercharger Stations'])
     }
 
 def get_sustainability_metrics():
@@ -361,16 +738,9 @@ def get_sustainability_metrics():
     Get sustainability metrics for radar chart.
     
     Returns:
-        dict: Sustainability metrics
+        Mapping: Sustainability metrics (read-only)
     """
-    return {
-        'Renewable Energy Use': 85,
-        'Water Recycling': 70,
-        'Waste Reduction': 65,
-        'Battery Recycling': 90,
-        'Carbon Footprint Reduction': 75,
-        'Sustainable Materials': 60
-    }
+    return _SUSTAINABILITY_METRICS
 
 def get_ev_market_share_data(year):
     """
@@ -380,74 +750,7 @@ def get_ev_market_share_data(year):
         year (int): The year for which to get market share data
         
     Returns:
-        dict: Market share data by manufacturer
-    """
-    # Market share data by year and manufacturer
-    market_share = {
-        2018: {
-            'Tesla': 12,
-            'BAIC': 8,
-            'BYD': 7,
-            'BMW': 6,
-            'Nissan': 6,
-            'Volkswagen': 5,
-            'Hyundai-Kia': 4,
-            'Others': 52
-        },
-        2019: {
-            'Tesla': 16,
-            'BAIC': 7,
-            'BYD': 7,
-            'Volkswagen': 7,
-            'BMW': 5,
-            'Nissan': 5,
-            'Hyundai-Kia': 5,
-            'Others': 48
-        },
-        2020: {
-            'Tesla': 18,
-            'Volkswagen': 8,
-            'SAIC': 7,
-            'BYD': 6,
-            'BMW': 5,
-            'Hyundai-Kia': 5,
-            'Nissan': 4,
-            'Others': 47
-        },
-        2021: {
-            'Tesla': 21,
-            'Volkswagen': 11,
-            'SAIC': 8,
-            'BYD': 7,
-            'Hyundai-Kia': 6,
-            'BMW': 5,
-            'Stellantis': 5,
-            'Others': 37
-        },
-        2022: {
-            'Tesla': 23,
-            'BYD': 11,
-            'Volkswagen': 10,
-            'SAIC': 7,
-            'Hyundai-Kia': 7,
-            'Stellantis': 6,
-            'BMW': 5,
-            'Others': 31
-        },
-        2023: {
-            'Tesla': 19,
-            'BYD': 17,
-            'Volkswagen': 9,
-            'SAIC': 8,
-            'Hyundai-Kia': 7,
-            'Stellantis': 6,
-            'BMW': 5,
-            'Others': 29
-        }
-    }
-    
+        Mapping: Market share data by manufacturer (read-only)
+    """
     # Return data for requested year or latest available
-    if year in market_share:
-        return market_share[year]
-    else:
-        return market_share[max(market_share.keys())]
+    return _MARKET_SHARE.get(year, _MARKET_SHARE[max(_MARKET_SHARE)])
@@ -0,0 +1,202 @@
+# Static CSS and HTML blocks for the dashboard page.
+# Kept in an imported module so the strings are built once per process
+# instead of on every Streamlit rerun.
+
+# Custom CSS with Times New Roman and Arial fonts
+DASHBOARD_CSS = '''
+<style>
+    /* Set dark gray background instead of pure black */
+    .stApp {
+        background-color: #121212 !important;
+        font-family: Arial, sans-serif !important;
+    }
+    .main, .block-container, [data-testid="stAppViewContainer"], [data-testid="stHeader"] {
+        background-color: #121212 !important;
+    }
+    /* Side bar styling */
+    [data-testid="stSidebar"] {
+        background-color: #1E1E1E !important;
+        border-right: 1px solid #444444;
+        font-family: Arial, sans-serif !important;
+    }
+    .block-container {
+        padding-top: 1rem;
+        padding-bottom: 1rem;
+    }
+    /* Headings with classic styling */
+    h1, h2, h3 {
+        font-family: "Times New Roman", Times, serif !important;
+        font-weight: bold !important;
+        color: #FFFFFF !important;
+        letter-spacing: 0.5px !important;
+        background-color: transparent !important;
+        box-shadow: none !important;
+        padding: 0 !important;
+        width: 100% !important;
+    }
+    h1 {
+        font-size: 2.5rem !important;
+        margin-bottom: 1.5rem !important;
+        border-bottom: 2px solid #FF3A33 !important;
+        padding-bottom: 0.5rem !important;
+        text-transform: uppercase !important;
+    }
+    h2 {
+        font-size: 1.8rem !important;
+        margin-top: 1.5rem !important;
+        margin-bottom: 1rem !important;
+        border-bottom: 1px solid #4CAF50 !important;
+        padding-bottom: 0.3rem !important;
+    }
+    h3 {
+        font-size: 1.4rem !important;
+        margin-top: 1.2rem !important;
+        margin-bottom: 0.8rem !important;
+        border-bottom: 1px solid #2196F3 !important;
+        padding-bottom: 0.2rem !important;
+    }
+    /* Body text */
+    p, li, div {
+        font-family: Arial, sans-serif !important;
+        font-size: 1rem !important;
+        color: #EEEEEE !important;
+        text-shadow: none !important;
+        line-height: 1.5 !important;
+    }
+    /* Chart styling with borders */
+    .stPlotlyChart {
+        background-color: #1E1E1E !important;
+        padding: 1.2rem;
+        border-radius: 0.5rem;
+        box-shadow: 0 2px 5px rgba(0,0,0,0.3);
+        margin-bottom: 1.5rem !important;
+        border: 1px solid #333333 !important;
+    }
+    /* Expanders */
+    .streamlit-expanderHeader {
+        font-family: Arial, sans-serif !important;
+        font-weight: bold !important;
+        color: #2196F3 !important; /* Blue for expanders */
+        background-color: #1E1E1E !important;
+        border: 1px solid #2196F3 !important;
+        border-radius: 4px !important;
+        padding: 0.5rem !important;
+        font-size: 1rem !important;
+        text-transform: uppercase !important;
+    }
+    /* Button styling */
+    .stButton>button {
+        background-color: #2196F3 !important;
+        color: white !important;
+        font-weight: bold !important;
+        border: 1px solid #64B5F6 !important;
+        padding: 0.4rem 0.8rem !important;
+        font-size: 1rem !important;
+        border-radius: 4px !important;
+        font-family: Arial, sans-serif !important;
+        text-transform: uppercase !important;
+    }
+    .stButton>button:hover {
+        background-color: #42A5F5 !important;
+        border: 1px solid #90CAF9 !important;
+    }
+    /* Form elements */
+    .stTextInput>div>div>input {
+        color: white !important;
+        background-color: #333333 !important;
+        border: 1px solid #555555 !important;
+        font-size: 1rem !important;
+        font-family: Arial, sans-serif !important;
+    }
+    /* Date inputs */
+    .stDateInput>div>div>input {
+        color: white !important;
+        background-color: #333333 !important;
+        border: 1px solid #555555 !important;
+        font-size: 1rem !important;
+        font-family: Arial, sans-serif !important;
+    }
+    /* Select boxes */
+    .stSelectbox>div>div>div>div {
+        color: white !important;
+        background-color: #333333 !important;
+        font-size: 1rem !important;
+        font-family: Arial, sans-serif !important;
+    }
+    /* Select box dropdown items */
+    .stSelectbox [data-baseweb="select"] {
+        color: white !important;
+        background-color: #333333 !important;
+        font-family: Arial, sans-serif !important;
+    }
+    /* Radio buttons */
+    .stRadio>div {
+        color: white !important;
+        background-color: #1E1E1E !important;
+        padding: 8px !important;
+        border-radius: 5px !important;
+        border: 1px solid #444444 !important;
+        font-family: Arial, sans-serif !important;
+    }
+    /* Section dividers */
+    hr {
+        border-color: #333333 !important;
+        margin: 1.5rem 0 !important;
+    }
+</style>
+'''
+
+# App title and description in dashboard style
+HEADER_HTML = '''
+<div style="background-color: #1E1E1E; padding: 20px; border-radius: 10px; margin-bottom: 25px; border-left: 5px solid #FF3A33; box-shadow: 0 4px 12px rgba(0,0,0,0.5);">
+    <h1 style="margin:0; padding:0; font-family: 'Times New Roman', Times, serif; font-weight: bold; text-transform: capitalize;">⚡ Tesla performance dashboard</h1>
+    <p style="margin-top:10px; font-family: Arial, sans-serif;">Real-time insights into Tesla's business across three key performance dimensions</p>
+</div>
+'''
+
+# Summary metric cards shown across the top of the page
+SUMMARY_CARDS_HTML = '''
+<div style="display:flex; flex-wrap:wrap; gap:10px; margin-bottom:20px;">
+    <div style="flex:1; min-width:200px; background-color:#1E1E1E; padding:15px; border-radius:5px; border-left:4px solid #FF3A33; box-shadow:0 2px 5px rgba(0,0,0,0.2);">
+        <h3 style="margin:0; font-size:1.2rem !important; color:#FF3A33 !important; font-family: 'Times New Roman', Times, serif; font-weight: bold; text-transform: capitalize;">Latest revenue</h3>
+        <p style="font-size:2rem !important; margin:5px 0 0 0; font-family: Arial, sans-serif;">$25.5B</p>
+        <p style="color:#4CAF50 !important; margin:0; font-family: Arial, sans-serif;">↑ 8.2% YoY</p>
+    </div>
+    <div style="flex:1; min-width:200px; background-color:#1E1E1E; padding:15px; border-radius:5px; border-left:4px solid #4CAF50; box-shadow:0 2px 5px rgba(0,0,0,0.2);">
+        <h3 style="margin:0; font-size:1.2rem !important; color:#4CAF50 !important; font-family: 'Times New Roman', Times, serif; font-weight: bold; text-transform: capitalize;">Quarterly deliveries</h3>
+        <p style="font-size:2rem !important; margin:5px 0 0 0; font-family: Arial, sans-serif;">422K</p>
+        <p style="color:#FF3A33 !important; margin:0; font-family: Arial, sans-serif;">↓ 3.7% QoQ</p>
+    </div>
+    <div style="flex:1; min-width:200px; background-color:#1E1E1E; padding:15px; border-radius:5px; border-left:4px solid #2196F3; box-shadow:0 2px 5px rgba(0,0,0,0.2);">
+        <h3 style="margin:0; font-size:1.2rem !important; color:#2196F3 !important; font-family: 'Times New Roman', Times, serif; font-weight: bold; text-transform: capitalize;">Sustainability score</h3>
+        <p style="font-size:2rem !important; margin:5px 0 0 0; font-family: Arial, sans-serif;">85/100</p>
+        <p style="color:#4CAF50 !important; margin:0; font-family: Arial, sans-serif;">↑ 5 points</p>
+    </div>
+</div>
+'''
+
+# Key performance indicator panel header and cards, rendered as one element
+KPI_PANEL_HTML = '''
+<div>
+<div style="background-color:#1E1E1E; padding:15px; border-radius:10px; border-top:3px solid #FF9800; margin-bottom:20px;">
+    <h2 style="margin-top:0; font-family: 'Times New Roman', Times, serif; font-weight: bold; text-transform: capitalize;">Key performance indicators</h2>
+</div>
+<div style="display:flex; flex-direction:column; gap:15px;">
+    <div style="background-color:#1E1E1E; padding:15px; border-radius:5px; border-left:4px solid #FF9800;">
+        <h3 style="margin:0; font-size:1.2rem !important; color:#FF9800 !important; font-family: 'Times New Roman', Times, serif; font-weight: bold; text-transform: capitalize;">Gross margin</h3>
+        <p style="font-size:1.8rem !important; margin:5px 0 0 0; font-family: Arial, sans-serif;">25.1%</p>
+        <p style="color:#FF3A33 !important; margin:0; font-family: Arial, sans-serif;">↓ 2.4% YoY</p>
+    </div>
+    <div style="background-color:#1E1E1E; padding:15px; border-radius:5px; border-left:4px solid #FF9800;">
+        <h3 style="margin:0; font-size:1.2rem !important; color:#FF9800 !important; font-family: 'Times New Roman', Times, serif; font-weight: bold; text-transform: capitalize;">Operating margin</h3>
+        <p style="font-size:1.8rem !important; margin:5px 0 0 0; font-family: Arial, sans-serif;">11.4%</p>
+        <p style="color:#FF3A33 !important; margin:0; font-family: Arial, sans-serif;">↓ 1.7% YoY</p>
+    </div>
+    <div style="background-color:#1E1E1E; padding:15px; border-radius:5px; border-left:4px solid #FF9800;">
+        <h3 style="margin:0; font-size:1.2rem !important; color:#FF9800 !important; font-family: 'Times New Roman', Times, serif; font-weight: bold; text-transform: capitalize;">Free cash flow</h3>
+        <p style="font-size:1.8rem !important; margin:5px 0 0 0; font-family: Arial, sans-serif;">$2.9B</p>
+        <p style="color:#4CAF50 !important; margin:0; font-family: Arial, sans-serif;">↑ 10.8% QoQ</p>
+    </div>
+</div>
+</div>
+'''
@@ -0,0 +1,93 @@
+# Shared data loading and chart building for the dashboard page.
+# Cached loaders live in this module rather than in the page script so they
+# are defined once per process instead of on every Streamlit rerun.
+import streamlit as st
+import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+import data_processor as dp
+import visualizations as viz
+
+# Income statement metrics shown on the financial chart; a tuple so it hashes cheaply as a cache key
+KEY_METRICS = ('Total Revenue', 'Gross Profit', 'Operating Income', 'Net Income')
+
+def _as_date(value):
+    """Truncate a date, datetime or timestamp to a plain date."""
+    return pd.Timestamp(value).date()
+
+# Load all required data. These run on load_all's worker threads, so they never show
+# their own spinner; the page's "Loading data..." spinner covers them.
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_tesla_data(start_date, end_date):
+    # Day granularity keeps the downstream disk cache keys stable within a day
+    return dp.get_stock_data("TSLA", _as_date(start_date), _as_date(end_date))
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def load_financial_statements(period="quarterly"):
+    return dp.get_financial_statements("TSLA", period)
+
+# Reference data that rarely changes is also persisted to disk so it survives restarts.
+# Streamlit ignores ttl for disk-persisted caches, so time-dependent loaders take the
+# current quarter count or year as an argument; a new period then gets a new cache entry.
+@st.cache_data(persist="disk", show_spinner=False)
+def load_delivery_data(periods):
+    return dp.get_tesla_delivery_data(periods)
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_environmental_data(last_year):
+    return dp.get_environmental_impact_data(last_year)
+
+@st.cache_data(persist="disk", show_spinner=False)
+def load_sustainability_metrics():
+    # Copy the read-only mapping into a dict so Streamlit can pickle it
+    return dict(dp.get_sustainability_metrics())
+
+# Build each chart once per distinct input; Streamlit hashes the data arguments
+@st.cache_data(ttl=3600)
+def build_financial_chart(financial_data, metrics, period, theme):
+    return viz.plot_financial_metrics(financial_data, metrics, period, theme)
+
+@st.cache_data(ttl=3600)
+def build_delivery_chart(delivery_data, theme):
+    return viz.plot_delivery_trends(delivery_data, theme)
+
+@st.cache_data(ttl=3600)
+def build_sustainability_chart(sustainability_data, theme):
+    return viz.plot_sustainability_radar(sustainability_data, theme)
+
+def clear_caches():
+    """Drop every cached dataset and chart so the next run reloads from source."""
+    st.cache_data.clear()
+    viz.clear_figure_cache()
+    dp.clear_disk_cache()
+
+def load_all(start_date, end_date, period):
+    """
+    Load every dataset the dashboard needs.
+    
+    The loaders are independent and mostly wait on I/O, so they run
+    concurrently. Each worker thread is attached to the current session's
+    script context so st.cache_data behaves as it does on the script thread.
+    
+    Args:
+        start_date (date): Start date for stock data
+        end_date (date): End date for stock data
+        period (str): 'quarterly' or 'annual' financial statements
+        
+    Returns:
+        dict: Loaded datasets keyed by name
+    """
+    # Hash the stock dates at day granularity so reruns within a day share a cache entry
+    start_date, end_date = _as_date(start_date), _as_date(end_date)
+    
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=5, initializer=add_script_run_ctx, initargs=(None, ctx)) as executor:
+        futures = {
+            'tesla': executor.submit(load_tesla_data, start_date, end_date),
+            'financials': executor.submit(load_financial_statements, period),
+            'deliveries': executor.submit(load_delivery_data, dp.get_delivery_quarter_count()),
+            'environmental': executor.submit(load_environmental_data, dp.get_last_environmental_year()),
+            'sustainability': executor.submit(load_sustainability_metrics)
+        }
+        return {name: future.result() for name, future in futures.items()}
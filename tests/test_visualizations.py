@@ -0,0 +1,29 @@
+import numpy as np
+import pandas as pd
+
+import visualizations as viz
+
+
+def _closes(dates, values):
+    """Build a minimal price frame with a Close column on the given dates."""
+    return pd.DataFrame({'Close': values}, index=pd.DatetimeIndex(dates))
+
+def test_normalized_comparison_handles_misaligned_indexes():
+    # The competitor trades on an earlier day TSLA lacks and repeats one of its dates
+    tesla = _closes(['2024-01-03', '2024-01-04', '2024-01-05'], [200.0, 210.0, 220.0])
+    competitor = _closes(
+        ['2024-01-02', '2024-01-04', '2024-01-04', '2024-01-05'], [50.0, 55.0, 99.0, 60.0]
+    )
+    
+    fig = viz._build_normalized_stock_comparison(tesla, {'F': competitor}, ['F'], 'plotly')
+    tsla_trace, competitor_trace = fig.data
+    
+    # Dates come out in order and every series is based on its own earliest close
+    for trace in (tsla_trace, competitor_trace):
+        x = pd.DatetimeIndex(trace.x)
+        assert x.is_monotonic_increasing
+        assert x.is_unique
+        assert np.isclose(trace.y[0], 100.0)
+    
+    assert pd.Timestamp(competitor_trace.x[0]) == pd.Timestamp('2024-01-02')
+    np.testing.assert_allclose(competitor_trace.y, [100.0, 110.0, 120.0], rtol=1e-5)
@@ -1,113 +1,327 @@
+import functools
+import hashlib
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 import pandas as pd
 import numpy as np
-import plotly.express as px
 import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import matplotlib.pyplot as plt
-import seaborn as sns
+import plotly.io as pio
 import data_processor as dp
 
+# Encode figures with orjson; st.plotly_chart serializes through plotly.io.to_json,
+# and orjson writes NumPy arrays directly instead of converting them to lists first
+pio.json.config.default_engine = 'orjson'
+
+# Colors shared across charts, defined once rather than on every call
+_TRACE_COLORS = ('#FF3A33', '#22BBFF', '#9B59FF', '#27AE60')  # Bright colors for better visibility
+_COMPETITOR_COLORS = ('#1C9BF0', '#27AE60', '#8E44AD', '#F1C40F', '#E67E22', '#3498DB')
+
+_MODEL_COLORS = MappingProxyType({
+    'Model 3': '#1C9BF0',
+    'Model Y': '#27AE60',
+    'Model S': '#E31937',
+    'Model X': '#8E44AD',
+    'Cybertruck': '#F1C40F'
+})
+
+_EV_COLORS = MappingProxyType({
+    'Tesla': '#E31937',
+    'BYD': '#1C9BF0',
+    'Volkswagen': '#27AE60',
+    'SAIC': '#8E44AD',
+    'BMW': '#F1C40F',
+    'Hyundai-Kia': '#E67E22',
+    'Nissan': '#3498DB',
+    'BAIC': '#9B59B6',
+    'Stellantis': '#2ECC71',
+    'Others': '#95A5A6'
+})
+
+# Unified hover and legend above the plot used by the main charts.
+# Nested values stay plain dicts because Plotly only accepts dicts for them.
+_DEFAULT_LAYOUT = MappingProxyType(dict(
+    hovermode="x unified",
+    legend=dict(
+        font=dict(size=14, color="white"),
+        orientation='h',
+        yanchor="bottom", 
+        y=1.02, 
+        xanchor="right", 
+        x=1
+    )
+))
+
+# Dark panel and high-contrast axis styling for the main charts, registered once as a
+# template and layered over the selected theme with template=theme + '+tesla_dark'
+_AXIS_STYLE = dict(
+    title_font=dict(size=16, color="white"),
+    tickfont=dict(size=14, color="white"),
+    gridcolor="rgba(255, 255, 255, 0.15)"
+)
+_DARK_TEMPLATE = go.layout.Template(layout=dict(
+    paper_bgcolor="rgba(30, 30, 42, 0.8)",  # Slightly transparent dark background
+    plot_bgcolor="rgba(30, 30, 42, 0.8)",
+    xaxis=_AXIS_STYLE,
+    yaxis=_AXIS_STYLE
+))
+pio.templates['tesla_dark'] = _DARK_TEMPLATE
+
+def _f32(values):
+    """Return values as a contiguous float32 array, halving the plotted payload."""
+    return np.ascontiguousarray(values, dtype=np.float32)
+
+# Figure specs for the price charts, which are not page-cached, keyed by a fingerprint of their input data.
+# Bounded so long sessions with many date ranges don't grow it without limit.
+_FIGURE_CACHE_SIZE = 64
+_figure_specs = OrderedDict()
+_figure_lock = threading.Lock()
+
+def _frame_key(frame):
+    """
+    Fingerprint a DataFrame by its contents.
+    
+    Equal data gives an equal key even when it arrives as a new object on
+    every rerun, which object identity would not.
+    
+    Args:
+        frame (DataFrame): Data to fingerprint
+        
+    Returns:
+        tuple: Shape, column names and a digest of the row hashes
+    """
+    row_hashes = pd.util.hash_pandas_object(frame, index=True).to_numpy()
+    return frame.shape, tuple(frame.columns), hashlib.sha1(row_hashes.tobytes()).hexdigest()
+
+def _cached_figure(key, build):
+    """
+    Return a fresh figure for key, building it only on a cache miss.
+    
+    Only the plain dict spec is stored; every caller gets its own Figure
+    built from it, so no Figure object is shared between sessions.
+    
+    Args:
+        key (tuple): Hashable cache key
+        build (callable): Builds the Figure when the key is not cached
+        
+    Returns:
+        Figure: Plotly figure object
+    """
+    with _figure_lock:
+        spec = _figure_specs.get(key)
+        if spec is not None:
+            _figure_specs.move_to_end(key)
+    
+    if spec is None:
+        spec = build().to_dict()
+        with _figure_lock:
+            _figure_specs[key] = spec
+            while len(_figure_specs) > _FIGURE_CACHE_SIZE:
+                _figure_specs.popitem(last=False)
+    
+    return go.Figure(spec)
+
+def _normalize_columns(values):
+    """
+    Rebase every column of a 2-D array to 100 at its first available value.
+    
+    All columns are divided in one broadcast over a contiguous float32
+    block rather than series by series.
+    
+    Args:
+        values (ndarray): Values with one row per date and one column per series
+        
+    Returns:
+        ndarray: float32 array of the same shape; a column whose base is
+        zero or missing comes back as NaN
+    """
+    values = np.ascontiguousarray(values, dtype=np.float32)
+    if values.shape[0] == 0:
+        return values.copy()
+    
+    # First non-missing value in each column (row 0 when the column is all NaN)
+    first = (~np.isnan(values)).argmax(axis=0)
+    base = values[first, np.arange(values.shape[1])]
+    base[base == 0] = np.nan
+    
+    normalized = values / base
+    normalized *= 100
+    return normalized
+
+def clear_figure_cache():
+    """Drop every cached figure spec, e.g. after the underlying data is reloaded."""
+    with _figure_lock:
+        _figure_specs.clear()
+
+# Sample financial statement values (USD millions) for the financial metrics chart,
+# stored as one array per period with a row per metric and a column per period
+_METRIC_NAMES = (
+    'Total Revenue',
+    'Gross Profit',
+    'Operating Income',
+    'Net Income',
+    'Total Assets',
+    'Total Liabilities',
+    'Total Stockholder Equity',
+    'Cash And Cash Equivalents',
+    'Operating Cash Flow',
+    'Capital Expenditure',
+    'Free Cash Flow',
+    'Dividend Payout',
+)
+_METRIC_ROWS = {name: row for row, name in enumerate(_METRIC_NAMES)}
+
+_QUARTERLY_LABELS = np.array([f'Q{i} {2023+(i//4)}' for i in range(1, 9)], dtype=object)
+_QUARTERLY_VALUES = np.array([
+    [18000, 19500, 21000, 23000, 24500, 26000, 29000, 31000],  # Total Revenue
+    [4500, 4900, 5100, 5400, 5900, 6300, 7000, 7800],  # Gross Profit
+    [2200, 2400, 2600, 2800, 3000, 3200, 3500, 3800],  # Operating Income
+    [1800, 2000, 2200, 2400, 2600, 2800, 3100, 3300],  # Net Income
+    [55000, 57000, 59000, 62000, 65000, 68000, 72000, 75000],  # Total Assets
+    [30000, 31000, 32000, 33000, 34000, 35000, 36000, 37000],  # Total Liabilities
+    [25000, 26000, 27000, 29000, 31000, 33000, 36000, 38000],  # Total Stockholder Equity
+    [8000, 8500, 9000, 9500, 10000, 10500, 11000, 11500],  # Cash And Cash Equivalents
+    [3000, 3200, 3400, 3600, 3800, 4000, 4200, 4400],  # Operating Cash Flow
+    [-1500, -1600, -1700, -1800, -1900, -2000, -2100, -2200],  # Capital Expenditure
+    [1500, 1600, 1700, 1800, 1900, 2000, 2100, 2200],  # Free Cash Flow
+    [0, 0, 0, 0, 0, 0, 0, 0]  # Dividend Payout
+], dtype=np.int64)
+
+_ANNUAL_LABELS = np.array([f'FY {2019+i}' for i in range(5)], dtype=object)
+_ANNUAL_VALUES = np.array([
+    [18000, 21000, 24500, 29000, 31000],  # Total Revenue
+    [4500, 5100, 5900, 7000, 7800],  # Gross Profit
+    [2200, 2600, 3000, 3500, 3800],  # Operating Income
+    [1800, 2200, 2600, 3100, 3300],  # Net Income
+    [55000, 59000, 65000, 72000, 75000],  # Total Assets
+    [30000, 32000, 34000, 36000, 37000],  # Total Liabilities
+    [25000, 27000, 31000, 36000, 38000],  # Total Stockholder Equity
+    [8000, 9000, 10000, 11000, 11500],  # Cash And Cash Equivalents
+    [3000, 3400, 3800, 4200, 4400],  # Operating Cash Flow
+    [-1500, -1700, -1900, -2100, -2200],  # Capital Expenditure
+    [1500, 1700, 1900, 2100, 2200],  # Free Cash Flow
+    [0, 0, 0, 0, 0]  # Dividend Payout
+], dtype=np.int64)
+
+# Sample quarterly financial ratios (%), one row per ratio over the quarterly labels,
+# built once at import and plotted directly without a long-format frame
+_RATIO_NAMES = ('Gross Margin', 'Operating Margin', 'Net Profit Margin', 'ROE')
+_RATIO_VALUES = np.array([
+    [25.3, 24.8, 26.1, 25.9, 25.4, 24.7, 25.1, 25.6],  # Gross Margin
+    [11.4, 10.8, 11.9, 11.2, 11.5, 11.0, 11.3, 11.7],  # Operating Margin
+    [9.2, 8.7, 9.5, 9.0, 9.3, 8.9, 9.1, 9.4],  # Net Profit Margin
+    [13.5, 13.1, 14.2, 13.8, 13.6, 13.2, 13.7, 14.0]  # ROE
+], dtype=np.float32)
+
+# Sample competitive positioning metrics, one row per metric and one column per company
+_COMPETITIVE_METRICS = ('Market Cap', 'Revenue Growth', 'Profit Margin', 'R&D Spending')
+_COMPETITIVE_ROWS = {name: row for row, name in enumerate(_COMPETITIVE_METRICS)}
+_COMPANY_NAMES = ('TSLA', 'F', 'GM', 'VWAGY', 'TM', 'XPEV', 'NIO')
+_COMPANY_COLUMNS = {name: column for column, name in enumerate(_COMPANY_NAMES)}
+_COMPETITIVE_TABLE = np.array([
+    [650, 52, 55, 70, 240, 12, 15],  # Market Cap ($B)
+    [25, 5, 2, 4, 3, 40, 45],  # Revenue Growth (%)
+    [12, 5, 6, 7, 8, -25, -30],  # Profit Margin (%)
+    [20, 8, 9, 15, 12, 30, 35]  # R&D Spending
+], dtype=np.float32)
+
+@functools.lru_cache(maxsize=32)
+def _financial_metric_rows(period, metrics):
+    """
+    Select the sample values for a period and metric set.
+    
+    Args:
+        period (str): 'quarterly' or 'annual'
+        metrics (tuple): Metrics to include
+        
+    Returns:
+        tuple: Period labels and a read-only array with one row per metric
+    """
+    if period == 'quarterly':
+        labels, values = _QUARTERLY_LABELS, _QUARTERLY_VALUES
+    else:
+        labels, values = _ANNUAL_LABELS, _ANNUAL_VALUES
+    n_periods = len(labels)
+    
+    # Requested rows in order; metrics without sample values get a simple ramp
+    fallback = 1000 * np.arange(1, n_periods + 1, dtype=np.int64)
+    rows = [values[_METRIC_ROWS[metric]] if metric in _METRIC_ROWS else fallback for metric in metrics]
+    rows = np.stack(rows) if rows else np.empty((0, n_periods), dtype=np.int64)
+    
+    # The cached array is shared between calls, so guard it against writes
+    rows.flags.writeable = False
+    return labels, rows
+
 def plot_stock_history(stock_data, theme):
     """
     Create a stock price history chart with volume.
     
     Args:
-        stock_data (DataFrame): Stock price data
+        stock_data (DataFrame): Stock price data with 'Close' and 'Volume' columns
         theme (str): Chart theme
         
     Returns:
         Figure: Plotly figure object
     """
-    # Create figure with secondary y-axis
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
-    
-    # Add stock price line
-    fig.add_trace(
-        go.Scatter(
-            x=stock_data.index,
-            y=stock_data['Close'],
+    # Rebuild only when the price data itself changes, not on every rerun
+    key = ('stock_history', _frame_key(stock_data), theme)
+    return _cached_figure(key, lambda: _build_stock_history(stock_data, theme))
+
+def _build_stock_history(stock_data, theme):
+    """Build the stock price history figure."""
+    # Compute both moving averages on the full series in one pass before thinning it for display
+    ma_50, ma_200 = dp.rolling_means(stock_data['Close'].to_numpy(), (50, 200))
+    
+    # Only plot a peak-preserving subset of long histories, as float32 arrays
+    keep = dp.downsample_positions(stock_data['Close'])
+    dates = stock_data.index[keep]
+    close = _f32(stock_data['Close'].to_numpy()[keep])
+    volume = _f32(stock_data['Volume'].to_numpy()[keep])
+    ma_50 = _f32(ma_50[keep])
+    ma_200 = _f32(ma_200[keep])
+    
+    # Build the traces and layout up front and assemble the figure in one pass;
+    # volume sits on a second y-axis overlaid on the right
+    traces = [
+        go.Scattergl(
+            x=dates,
+            y=close,
             name="Stock Price",
             line=dict(color='#FF3A33', width=4)  # Brighter red, thicker line
         ),
-        secondary_y=False
-    )
-    
-    # Add volume bars
-    fig.add_trace(
         go.Bar(
-            x=stock_data.index,
-            y=stock_data['Volume'],
+            x=dates,
+            y=volume,
             name="Volume",
+            yaxis='y2',
             marker=dict(color='rgba(180, 180, 180, 0.4)')  # Brighter, more visible volume bars
         ),
-        secondary_y=True
-    )
-    
-    # Add moving averages
-    fig.add_trace(
-        go.Scatter(
-            x=stock_data.index,
-            y=stock_data['Close'].rolling(window=50).mean(),
+        go.Scattergl(
+            x=dates,
+            y=ma_50,
             name="50-Day MA",
             line=dict(color='#22BBFF', width=2.5)  # Brighter blue, thicker line
         ),
-        secondary_y=False
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=stock_data.index,
-            y=stock_data['Close'].rolling(window=200).mean(),
+        go.Scattergl(
+            x=dates,
+            y=ma_200,
             name="200-Day MA",
             line=dict(color='#9B59FF', width=2.5)  # Brighter purple, thicker line
-        ),
-        secondary_y=False
-    )
+        )
+    ]
     
-    # Set figure layout
-    fig.update_layout(
+    layout = dict(
         title="Tesla Stock Price History",
-        template=theme,
-        hovermode="x unified",
-        legend=dict(
-            orientation="h", 
-            yanchor="bottom", 
-            y=1.02, 
-            xanchor="right", 
-            x=1,
-            font=dict(size=14, color="white")
-        ),
+        template=theme + '+tesla_dark',
         height=600,  # Taller chart
         margin=dict(l=50, r=50, t=80, b=50),  # More margin space
-        paper_bgcolor="rgba(30, 30, 42, 0.8)",  # Slightly transparent dark background
-        plot_bgcolor="rgba(30, 30, 42, 0.8)"
-    )
-    
-    # Set axis titles with improved formatting
-    fig.update_xaxes(
-        title_text="Date",
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)"
+        xaxis=dict(title_text="Date"),
+        yaxis=dict(title_text="Stock Price ($)"),
+        yaxis2=dict(title_text="Volume", overlaying='y', side='right'),
+        **_DEFAULT_LAYOUT
     )
     
-    fig.update_yaxes(
-        title_text="Stock Price ($)", 
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)",
-        secondary_y=False
-    )
-    
-    fig.update_yaxes(
-        title_text="Volume", 
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)",
-        secondary_y=True
-    )
-    
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
 def plot_financial_metrics(financial_data, metrics, period, theme):
     """
@@ -115,116 +329,40 @@ def plot_financial_metrics(financial_data, metrics, period, theme):
     
     Args:
         financial_data (DataFrame): Financial statement data (not used, kept for API compatibility)
-        metrics (list): List of metrics to display
+        metrics (tuple): Metrics to display
         period (str): 'Quarterly' or 'Annual'
         theme (str): Chart theme
         
     Returns:
         Figure: Plotly figure object
     """
-    # Create dummy data with fixed length arrays to ensure consistency
-    if period.lower() == 'quarterly':
-        # For quarterly, create 8 quarters of data
-        date_labels = [f'Q{i} {2023+(i//4)}' for i in range(1, 9)]
-        
-        data = {
-            'Date': date_labels,
-            'Total Revenue': [18000, 19500, 21000, 23000, 24500, 26000, 29000, 31000],
-            'Gross Profit': [4500, 4900, 5100, 5400, 5900, 6300, 7000, 7800],
-            'Operating Income': [2200, 2400, 2600, 2800, 3000, 3200, 3500, 3800],
-            'Net Income': [1800, 2000, 2200, 2400, 2600, 2800, 3100, 3300],
-            'Total Assets': [55000, 57000, 59000, 62000, 65000, 68000, 72000, 75000],
-            'Total Liabilities': [30000, 31000, 32000, 33000, 34000, 35000, 36000, 37000],
-            'Total Stockholder Equity': [25000, 26000, 27000, 29000, 31000, 33000, 36000, 38000],
-            'Cash And Cash Equivalents': [8000, 8500, 9000, 9500, 10000, 10500, 11000, 11500],
-            'Operating Cash Flow': [3000, 3200, 3400, 3600, 3800, 4000, 4200, 4400],
-            'Capital Expenditure': [-1500, -1600, -1700, -1800, -1900, -2000, -2100, -2200],
-            'Free Cash Flow': [1500, 1600, 1700, 1800, 1900, 2000, 2100, 2200],
-            'Dividend Payout': [0, 0, 0, 0, 0, 0, 0, 0],
-        }
-    else:  # annual
-        # For annual, create 5 years of data
-        date_labels = [f'FY {2019+i}' for i in range(5)]
-        
-        data = {
-            'Date': date_labels,
-            'Total Revenue': [18000, 21000, 24500, 29000, 31000],
-            'Gross Profit': [4500, 5100, 5900, 7000, 7800],
-            'Operating Income': [2200, 2600, 3000, 3500, 3800],
-            'Net Income': [1800, 2200, 2600, 3100, 3300],
-            'Total Assets': [55000, 59000, 65000, 72000, 75000],
-            'Total Liabilities': [30000, 32000, 34000, 36000, 37000],
-            'Total Stockholder Equity': [25000, 27000, 31000, 36000, 38000],
-            'Cash And Cash Equivalents': [8000, 9000, 10000, 11000, 11500],
-            'Operating Cash Flow': [3000, 3400, 3800, 4200, 4400],
-            'Capital Expenditure': [-1500, -1700, -1900, -2100, -2200],
-            'Free Cash Flow': [1500, 1700, 1900, 2100, 2200],
-            'Dividend Payout': [0, 0, 0, 0, 0],
-        }
-    
-    # Only include the requested metrics
-    data_subset = {'Date': data['Date']}
-    for metric in metrics:
-        if metric in data:
-            data_subset[metric] = data[metric]
-        else:
-            # Create fallback data with same length as the date array
-            data_subset[metric] = [1000 * (i+1) for i in range(len(data['Date']))]
-    
-    # Create DataFrame from the subset
-    dummy_data = pd.DataFrame(data_subset)
-    
-    # Convert to long format for plotting
-    data_long = dummy_data.melt(id_vars='Date', var_name='Metric', value_name='Value')
-    
-    # Create bar chart
-    fig = px.bar(
-        data_long,
-        x='Date',
-        y='Value',
-        color='Metric',
-        barmode='group',
-        title=f"{period} Financial Metrics",
-        template=theme,
-        height=500,
-        color_discrete_sequence=['#FF3A33', '#22BBFF', '#9B59FF', '#27AE60']  # Bright colors for better visibility
-    )
-    
-    # Update layout
-    fig.update_layout(
-        xaxis_title="",
-        yaxis_title="USD (Millions)",
-        legend_title="Metric",
-        hovermode="x unified",
-        legend=dict(
-            font=dict(size=14, color="white"),
-            orientation='h',
-            yanchor="bottom", 
-            y=1.02, 
-            xanchor="right", 
-            x=1
-        ),
-        paper_bgcolor="rgba(30, 30, 42, 0.8)",
-        plot_bgcolor="rgba(30, 30, 42, 0.8)"
-    )
+    # Values of the requested metrics, selected once per period and metric set
+    labels, rows = _financial_metric_rows(period.lower(), tuple(metrics))
     
-    # Update the axis titles and style
-    fig.update_xaxes(
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)"
-    )
+    # Create grouped bar chart with one trace per metric, hover values in millions
+    traces = [
+        go.Bar(
+            x=labels,
+            y=row,
+            name=metric,
+            marker_color=_TRACE_COLORS[i % len(_TRACE_COLORS)],
+            hovertemplate='%{y:,.2f}'
+        )
+        for i, (metric, row) in enumerate(zip(metrics, rows))
+    ]
     
-    fig.update_yaxes(
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)"
+    layout = dict(
+        title=f"{period} Financial Metrics",
+        template=theme + '+tesla_dark',
+        height=500,
+        barmode='group',
+        xaxis=dict(title_text=""),
+        yaxis=dict(title_text="USD (Millions)"),
+        legend_title_text="Metric",
+        **_DEFAULT_LAYOUT
     )
     
-    # Format y-axis to show in millions
-    fig.update_traces(hovertemplate='%{y:,.2f}')
-    
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
 def plot_financial_ratios(ratio_data, theme):
     """
@@ -237,74 +375,31 @@ def plot_financial_ratios(ratio_data, theme):
     Returns:
         Figure: Plotly figure object
     """
-    # Create sample financial ratio data for plotting
-    periods = 8
-    dates = [f'Q{i} {2023+(i//4)}' for i in range(1, periods+1)]
-    
-    dummy_data = pd.DataFrame({
-        'Date': dates,
-        'Gross Margin': [25.3, 24.8, 26.1, 25.9, 25.4, 24.7, 25.1, 25.6],
-        'Operating Margin': [11.4, 10.8, 11.9, 11.2, 11.5, 11.0, 11.3, 11.7],
-        'Net Profit Margin': [9.2, 8.7, 9.5, 9.0, 9.3, 8.9, 9.1, 9.4],
-        'ROE': [13.5, 13.1, 14.2, 13.8, 13.6, 13.2, 13.7, 14.0]
-    })
-    
-    # Convert to long format for plotting
-    data_long = dummy_data.melt(id_vars='Date', var_name='Ratio', value_name='Percentage')
-    
-    # Create line chart
-    fig = px.line(
-        data_long,
-        x='Date',
-        y='Percentage',
-        color='Ratio',
-        markers=True,
+    # Create line chart with one WebGL trace per ratio, with large markers and thick lines
+    traces = [
+        go.Scattergl(
+            x=_QUARTERLY_LABELS,
+            y=row,
+            name=ratio,
+            mode='lines+markers',
+            line=dict(color=_TRACE_COLORS[i % len(_TRACE_COLORS)], width=3),
+            marker=dict(size=10),
+            hovertemplate='%{y:.2f}%'
+        )
+        for i, (ratio, row) in enumerate(zip(_RATIO_NAMES, _RATIO_VALUES))
+    ]
+    
+    layout = dict(
         title="Financial Ratio Trends",
-        template=theme,
+        template=theme + '+tesla_dark',
         height=450,
-        line_shape='spline',  # Smoother lines
-        color_discrete_sequence=['#FF3A33', '#22BBFF', '#9B59FF', '#27AE60']  # Bright colors
+        xaxis=dict(title_text=""),
+        yaxis=dict(title_text="Percentage (%)"),
+        legend_title_text="Ratio",
+        **_DEFAULT_LAYOUT
     )
     
-    # Update layout
-    fig.update_layout(
-        xaxis_title="",
-        yaxis_title="Percentage (%)",
-        legend_title="Ratio",
-        hovermode="x unified",
-        legend=dict(
-            font=dict(size=14, color="white"),
-            orientation='h',
-            yanchor="bottom", 
-            y=1.02, 
-            xanchor="right", 
-            x=1
-        ),
-        paper_bgcolor="rgba(30, 30, 42, 0.8)",
-        plot_bgcolor="rgba(30, 30, 42, 0.8)"
-    )
-    
-    # Update the axis titles and style
-    fig.update_xaxes(
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)"
-    )
-    
-    fig.update_yaxes(
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)"
-    )
-    
-    # Format y-axis and increase marker size
-    fig.update_traces(
-        hovertemplate='%{y:.2f}%',
-        marker=dict(size=10),
-        line=dict(width=3)
-    )
-    
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
 def plot_delivery_trends(delivery_data, theme):
     """
@@ -317,93 +412,40 @@ def plot_delivery_trends(delivery_data, theme):
     Returns:
         Figure: Plotly figure object
     """
-    # Create a figure
-    fig = go.Figure()
-    
-    # Add total deliveries line
-    fig.add_trace(
-        go.Scatter(
-            x=delivery_data.index,
-            y=delivery_data['Total Deliveries'],
-            name="Total Deliveries",
-            line=dict(color='#E31937', width=3),
-            mode='lines+markers'
-        )
-    )
-    
-    # Add model group lines
-    fig.add_trace(
-        go.Scatter(
-            x=delivery_data.index,
-            y=delivery_data['Model 3/Y'],
-            name="Model 3/Y",
-            line=dict(color='#1C9BF0', width=2),
-            mode='lines+markers'
-        )
-    )
-    
-    fig.add_trace(
-        go.Scatter(
-            x=delivery_data.index,
-            y=delivery_data['Model S/X'],
-            name="Model S/X",
-            line=dict(color='#8E44AD', width=2),
-            mode='lines+markers'
-        )
-    )
-    
-    # Add Cybertruck if it exists in the data
+    # Line color and width per delivery series; Cybertruck only when present
+    series = [
+        ('Total Deliveries', '#E31937', 3),
+        ('Model 3/Y', '#1C9BF0', 2),
+        ('Model S/X', '#8E44AD', 2)
+    ]
     if 'Cybertruck' in delivery_data.columns:
-        fig.add_trace(
-            go.Scatter(
-                x=delivery_data.index,
-                y=delivery_data['Cybertruck'],
-                name="Cybertruck",
-                line=dict(color='#27AE60', width=2),
-                mode='lines+markers'
-            )
+        series.append(('Cybertruck', '#27AE60', 2))
+    
+    # One WebGL trace per series with its final styling and hover format
+    quarters = delivery_data.index
+    traces = [
+        go.Scattergl(
+            x=quarters,
+            y=_f32(delivery_data[name].to_numpy()),
+            name=name,
+            line=dict(color=color, width=width),
+            mode='lines+markers',
+            marker=dict(size=10),
+            hovertemplate='%{y:,.0f} vehicles'
         )
+        for name, color, width in series
+    ]
     
-    # Set figure layout
-    fig.update_layout(
+    layout = dict(
         title="Tesla Quarterly Vehicle Deliveries",
-        template=theme,
-        hovermode="x unified",
-        legend=dict(
-            font=dict(size=14, color="white"),
-            orientation='h',
-            yanchor="bottom", 
-            y=1.02, 
-            xanchor="right", 
-            x=1
-        ),
+        template=theme + '+tesla_dark',
         height=550,
-        paper_bgcolor="rgba(30, 30, 42, 0.8)",
-        plot_bgcolor="rgba(30, 30, 42, 0.8)"
+        xaxis=dict(title_text="Quarter"),
+        yaxis=dict(title_text="Vehicles Delivered"),
+        **_DEFAULT_LAYOUT
     )
     
-    # Set axis titles and improve visibility
-    fig.update_xaxes(
-        title_text="Quarter",
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)"
-    )
-    
-    fig.update_yaxes(
-        title_text="Vehicles Delivered",
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)"
-    )
-    
-    # Format y-axis values and enhance markers
-    fig.update_traces(
-        hovertemplate='%{y:,.0f} vehicles',
-        marker=dict(size=10)
-    )
-    
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
 def plot_model_mix(delivery_data, theme):
     """
@@ -416,50 +458,41 @@ def plot_model_mix(delivery_data, theme):
     Returns:
         Figure: Plotly figure object
     """
-    # Sum deliveries for each model across the selected time period
-    model_mix = {
-        'Model 3': delivery_data['Model 3'].sum(),
-        'Model Y': delivery_data['Model Y'].sum(),
-        'Model S': delivery_data['Model S'].sum(),
-        'Model X': delivery_data['Model X'].sum()
-    }
-    
-    # Add Cybertruck if it exists in the data and has non-zero deliveries
-    if 'Cybertruck' in delivery_data.columns and delivery_data['Cybertruck'].sum() > 0:
-        model_mix['Cybertruck'] = delivery_data['Cybertruck'].sum()
+    # Sum deliveries for each model across the selected time period in one pass
+    models = ['Model 3', 'Model Y', 'Model S', 'Model X']
+    if 'Cybertruck' in delivery_data.columns:
+        models.append('Cybertruck')
+    sums = delivery_data[models].to_numpy().sum(axis=0).tolist()
     
-    # Create dataframe for plotting
-    mix_df = pd.DataFrame({'Model': model_mix.keys(), 'Deliveries': model_mix.values()})
+    # Only show Cybertruck if it has non-zero deliveries
+    totals = tuple((model, total) for model, total in zip(models, sums)
+                   if model != 'Cybertruck' or total > 0)
     
-    # Set colors for each model
-    colors = {
-        'Model 3': '#1C9BF0',
-        'Model Y': '#27AE60',
-        'Model S': '#E31937',
-        'Model X': '#8E44AD',
-        'Cybertruck': '#F1C40F'
-    }
+    # The chart only depends on the per-model totals, so those key the cached figure
+    return go.Figure(_model_mix_spec(totals, theme))
+
+@functools.lru_cache(maxsize=64)
+def _model_mix_spec(totals, theme):
+    """Build the model mix pie from (model, deliveries) pairs as a plain figure dict."""
+    models = [model for model, _ in totals]
+    
+    # Create pie chart with its labels and hover text set up front
+    pie = go.Pie(
+        labels=models,
+        values=[deliveries for _, deliveries in totals],
+        marker=dict(colors=[_MODEL_COLORS[model] for model in models]),
+        textposition='inside',
+        textinfo='percent+label',
+        hovertemplate='%{label}: %{value:,.0f} vehicles (%{percent})'
+    )
     
-    # Create pie chart
-    fig = px.pie(
-        mix_df,
-        values='Deliveries',
-        names='Model',
+    layout = dict(
         title="Vehicle Delivery Breakdown by Model",
-        color='Model',
-        color_discrete_map=colors,
         template=theme,
         height=500
     )
     
-    # Update layout
-    fig.update_traces(
-        textposition='inside',
-        textinfo='percent+label',
-        hovertemplate='%{label}: %{value:,.0f} vehicles (%{percent})'
-    )
-    
-    return fig
+    return go.Figure(data=[pie], layout=layout).to_dict()
 
 def plot_regional_sales(theme):
     """
@@ -471,6 +504,12 @@ def plot_regional_sales(theme):
     Returns:
         Figure: Plotly figure object
     """
+    # The map is static, so it is built once per theme
+    return go.Figure(_regional_sales_spec(theme))
+
+@functools.lru_cache(maxsize=64)
+def _regional_sales_spec(theme):
+    """Build the regional sales map as a plain figure dict."""
     # Regional sales distribution (approximate percentages)
     regions = {
         'United States': 45,
@@ -479,30 +518,30 @@ def plot_regional_sales(theme):
         'Rest of World': 10
     }
     
-    # Create dataframe for map
-    region_data = pd.DataFrame({
-        'country': ['USA', 'China', 'Germany', 'Canada', 'Norway', 'Netherlands', 
-                   'United Kingdom', 'France', 'Australia', 'Japan', 'South Korea',
-                   'Brazil', 'Mexico', 'India', 'United Arab Emirates'],
-        'sales_percentage': [40, 25, 7, 5, 4, 3, 3, 3, 2, 2, 2, 1, 1, 1, 1]
-    })
+    # Sales share by country for the map
+    countries = ['USA', 'China', 'Germany', 'Canada', 'Norway', 'Netherlands', 
+                 'United Kingdom', 'France', 'Australia', 'Japan', 'South Korea',
+                 'Brazil', 'Mexico', 'India', 'United Arab Emirates']
+    sales_percentage = [40, 25, 7, 5, 4, 3, 3, 3, 2, 2, 2, 1, 1, 1, 1]
     
     # Create choropleth map
-    fig = px.choropleth(
-        region_data,
-        locations='country',
+    choropleth = go.Choropleth(
+        locations=countries,
         locationmode='country names',
-        color='sales_percentage',
-        color_continuous_scale='Reds',
-        template=theme,
-        title="Tesla Global Sales Distribution",
-        height=600
+        z=sales_percentage,
+        coloraxis='coloraxis',
+        hovertemplate='%{location}: %{z}%<extra></extra>'
     )
     
-    # Update layout
-    fig.update_layout(
-        coloraxis_colorbar=dict(
-            title="Sales %"
+    layout = dict(
+        title="Tesla Global Sales Distribution",
+        template=theme,
+        height=600,
+        coloraxis=dict(
+            colorscale='Reds',
+            colorbar=dict(
+                title="Sales %"
+            )
         ),
         geo=dict(
             showframe=False,
@@ -511,7 +550,7 @@ def plot_regional_sales(theme):
         )
     )
     
-    return fig
+    return go.Figure(data=[choropleth], layout=layout).to_dict()
 
 def plot_normalized_stock_comparison(tesla_data, competitor_data, tickers, theme):
     """
@@ -526,82 +565,62 @@ def plot_normalized_stock_comparison(tesla_data, competitor_data, tickers, theme
     Returns:
         Figure: Plotly figure object
     """
-    # Create figure
-    fig = go.Figure()
-    
-    # Normalize Tesla data (first day = 100)
-    tesla_normalized = tesla_data['Close'] / tesla_data['Close'].iloc[0] * 100
-    
-    # Add Tesla line
-    fig.add_trace(
-        go.Scatter(
-            x=tesla_normalized.index,
-            y=tesla_normalized,
-            name="TSLA",
-            line=dict(color='#E31937', width=3)
-        )
+    # Rebuild only when any of the plotted price data changes, not on every rerun
+    competitor_keys = tuple(
+        (ticker, _frame_key(competitor_data[ticker]))
+        for ticker in tickers if ticker in competitor_data
     )
-    
-    # Add competitor lines
-    colors = ['#1C9BF0', '#27AE60', '#8E44AD', '#F1C40F', '#E67E22', '#3498DB']
+    key = ('normalized_comparison', _frame_key(tesla_data), tuple(tickers), competitor_keys, theme)
+    return _cached_figure(
+        key, lambda: _build_normalized_stock_comparison(tesla_data, competitor_data, tickers, theme)
+    )
+
+def _build_normalized_stock_comparison(tesla_data, competitor_data, tickers, theme):
+    """Build the normalized stock comparison figure."""
+    # Line style per series, keeping each competitor's palette slot from the ticker list
+    names = ['TSLA']
+    closes = [tesla_data['Close']]
+    lines = [dict(color='#E31937', width=3)]
     
     for i, ticker in enumerate(tickers):
         # Skip if ticker data is missing or invalid
         if ticker not in competitor_data or competitor_data[ticker].empty:
             continue
-            
-        # Normalize competitor data
-        comp_normalized = competitor_data[ticker]['Close'] / competitor_data[ticker]['Close'].iloc[0] * 100
-        
-        # Add line to chart
-        fig.add_trace(
-            go.Scatter(
-                x=comp_normalized.index,
-                y=comp_normalized,
-                name=ticker,
-                line=dict(color=colors[i % len(colors)], width=2)
-            )
+        names.append(ticker)
+        closes.append(competitor_data[ticker]['Close'])
+        lines.append(dict(color=_COMPETITOR_COLORS[i % len(_COMPETITOR_COLORS)], width=2))
+    
+    # Line every close series up side by side on one sorted date axis and normalize them
+    # all at once (first day = 100); a repeated date would make the union ambiguous, so
+    # each series keeps only its first row per date
+    closes = [close[~close.index.duplicated(keep='first')] for close in closes]
+    wide = pd.concat(closes, axis=1, keys=names).sort_index()
+    values = wide.to_numpy(dtype=np.float32)
+    normalized = _normalize_columns(values)
+    present = ~np.isnan(values)
+    
+    # One line per series, over the dates that series actually has
+    traces = [
+        go.Scattergl(
+            x=wide.index[present[:, k]],
+            y=normalized[present[:, k], k],
+            name=name,
+            line=lines[k],
+            hovertemplate='%{y:.2f}'
         )
+        for k, name in enumerate(names)
+    ]
     
-    # Set figure layout
-    fig.update_layout(
+    layout = dict(
         title="Normalized Stock Performance Comparison (First Day = 100)",
-        template=theme,
-        hovermode="x unified",
-        legend=dict(
-            font=dict(size=14, color="white"),
-            orientation='h',
-            yanchor="bottom", 
-            y=1.02, 
-            xanchor="right", 
-            x=1
-        ),
+        template=theme + '+tesla_dark',
         height=550,
-        paper_bgcolor="rgba(30, 30, 42, 0.8)",
-        plot_bgcolor="rgba(30, 30, 42, 0.8)"
+        xaxis=dict(title_text="Date"),
+        yaxis=dict(title_text="Normalized Price (First Day = 100)"),
+        **_DEFAULT_LAYOUT
     )
     
-    # Set axis titles with improved visibility
-    fig.update_xaxes(
-        title_text="Date",
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)"
-    )
-    
-    fig.update_yaxes(
-        title_text="Normalized Price (First Day = 100)",
-        title_font=dict(size=16, color="white"),
-        tickfont=dict(size=14, color="white"),
-        gridcolor="rgba(255, 255, 255, 0.15)"
-    )
-    
-    # Format hover template
-    fig.update_traces(
-        hovertemplate='%{y:.2f}'
-    )
-    
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
 def plot_ev_market_share(year, theme):
     """
@@ -614,49 +633,34 @@ def plot_ev_market_share(year, theme):
     Returns:
         Figure: Plotly figure object
     """
+    # Market share data is fixed per year, so the figure is built once per year and theme
+    return go.Figure(_ev_market_share_spec(year, theme))
+
+@functools.lru_cache(maxsize=64)
+def _ev_market_share_spec(year, theme):
+    """Build the EV market share pie as a plain figure dict."""
     # Get market share data for the selected year
     market_share = dp.get_ev_market_share_data(year)
     
-    # Create dataframe for plotting
-    share_df = pd.DataFrame({
-        'Manufacturer': market_share.keys(),
-        'Market Share': market_share.values()
-    })
-    
-    # Set colors
-    colors = {
-        'Tesla': '#E31937',
-        'BYD': '#1C9BF0',
-        'Volkswagen': '#27AE60',
-        'SAIC': '#8E44AD',
-        'BMW': '#F1C40F',
-        'Hyundai-Kia': '#E67E22',
-        'Nissan': '#3498DB',
-        'BAIC': '#9B59B6',
-        'Stellantis': '#2ECC71',
-        'Others': '#95A5A6'
-    }
-    
-    # Create pie chart
-    fig = px.pie(
-        share_df,
-        values='Market Share',
-        names='Manufacturer',
-        title=f"Global EV Market Share {year}",
-        color='Manufacturer',
-        color_discrete_map=colors,
-        template=theme,
-        height=500
-    )
+    manufacturers = list(market_share)
     
-    # Update layout
-    fig.update_traces(
+    # Create pie chart with its labels and hover text set up front
+    pie = go.Pie(
+        labels=manufacturers,
+        values=list(market_share.values()),
+        marker=dict(colors=[_EV_COLORS[name] for name in manufacturers]),
         textposition='inside',
         textinfo='percent+label',
         hovertemplate='%{label}: %{value}% market share'
     )
     
-    return fig
+    layout = dict(
+        title=f"Global EV Market Share {year}",
+        template=theme,
+        height=500
+    )
+    
+    return go.Figure(data=[pie], layout=layout).to_dict()
 
 def plot_competitive_matrix(x_metric, y_metric, competitors, theme):
     """
@@ -671,88 +675,56 @@ def plot_competitive_matrix(x_metric, y_metric, competitors, theme):
     Returns:
         Figure: Plotly figure object
     """
-    # Define metric data for each company
+    # The sample metrics are fixed, so the figure is built once per selection
+    return go.Figure(_competitive_matrix_spec(x_metric, y_metric, tuple(competitors), theme))
+
+@functools.lru_cache(maxsize=64)
+def _competitive_matrix_spec(x_metric, y_metric, competitors, theme):
+    """Build the competitive bubble chart as a plain figure dict."""
+    # Companies with sample metrics, in the order requested
     companies = ['TSLA'] + [ticker.split(' ')[0] for ticker in competitors]
+    shown = [company for company in companies if company in _COMPANY_COLUMNS]
+    columns = [_COMPANY_COLUMNS[company] for company in shown]
     
-    # Define sample data for each metric
-    metrics = {
-        'Market Cap': {
-            'TSLA': 650,
-            'F': 52,
-            'GM': 55,
-            'VWAGY': 70,
-            'TM': 240,
-            'XPEV': 12,
-            'NIO': 15
-        },
-        'Revenue Growth': {
-            'TSLA': 25,
-            'F': 5,
-            'GM': 2,
-            'VWAGY': 4,
-            'TM': 3,
-            'XPEV': 40,
-            'NIO': 45
-        },
-        'Profit Margin': {
-            'TSLA': 12,
-            'F': 5,
-            'GM': 6,
-            'VWAGY': 7,
-            'TM': 8,
-            'XPEV': -25,
-            'NIO': -30
-        },
-        'R&D Spending': {
-            'TSLA': 20,
-            'F': 8,
-            'GM': 9,
-            'VWAGY': 15,
-            'TM': 12,
-            'XPEV': 30,
-            'NIO': 35
-        }
-    }
+    # Take the selected metric rows for those companies straight from the table
+    x_values = _COMPETITIVE_TABLE[_COMPETITIVE_ROWS[x_metric], columns]
+    y_values = _COMPETITIVE_TABLE[_COMPETITIVE_ROWS[y_metric], columns]
+    sizes = _COMPETITIVE_TABLE[_COMPETITIVE_ROWS['Market Cap'], columns]
+    
+    # Bubble areas scale with market cap, the largest drawn 50px across
+    sizeref = 2.0 * sizes.max() / 50 ** 2 if len(sizes) else 1
     
-    # Create data for plotting
-    data = []
-    for company in companies:
-        if company in metrics[x_metric] and company in metrics[y_metric]:
-            data.append({
-                'Company': company,
-                x_metric: metrics[x_metric][company],
-                y_metric: metrics[y_metric][company],
-                'EV Focus': 100 if company == 'TSLA' or company == 'XPEV' or company == 'NIO' else 25,
-                'Size': metrics['Market Cap'][company]
-            })
-    
-    # Create dataframe
-    df = pd.DataFrame(data)
-    
-    # Create bubble chart
-    fig = px.scatter(
-        df,
-        x=x_metric,
-        y=y_metric,
-        size='Size',
-        color='Company',
-        text='Company',
-        size_max=50,
+    # Tesla in red, competitors in the shared palette
+    colors = ['#E31937' if company == 'TSLA' else _COMPETITOR_COLORS[i % len(_COMPETITOR_COLORS)]
+              for i, company in enumerate(shown)]
+    
+    # One bubble trace per company so each gets a legend entry and a named hover box;
+    # the shared sizeref keeps bubble areas comparable across traces
+    bubbles = [
+        go.Scatter(
+            x=x_values[k:k + 1],
+            y=y_values[k:k + 1],
+            name=company,
+            text=[company],
+            mode='markers+text',
+            textposition='top center',
+            marker=dict(size=sizes[k:k + 1], sizemode='area', sizeref=sizeref, color=colors[k]),
+            hovertemplate=f'{x_metric}: %{{x}}<br>' +
+                          f'{y_metric}: %{{y}}<br>' +
+                          'Market Cap: $%{marker.size}B'
+        )
+        for k, company in enumerate(shown)
+    ]
+    
+    layout = dict(
         title=f"Competitive Analysis: {x_metric} vs {y_metric}",
         template=theme,
-        height=500
-    )
-    
-    # Update layout
-    fig.update_traces(
-        textposition='top center',
-        hovertemplate='%{text}<br>' +
-                      f'{x_metric}: %{{x}}<br>' +
-                      f'{y_metric}: %{{y}}<br>' +
-                      'Market Cap: $%{marker.size}B'
+        height=500,
+        xaxis=dict(title_text=x_metric),
+        yaxis=dict(title_text=y_metric)
     )
     
-    return fig
+    return go.Figure(data=bubbles, layout=layout).to_dict()
 
 def plot_carbon_offset(environmental_data, theme):
     """
@@ -765,47 +737,40 @@ def plot_carbon_offset(environmental_data, theme):
     Returns:
         Figure: Plotly figure object
     """
-    # Create figure
-    fig = go.Figure()
-    
-    # Add bar chart for carbon offset
-    fig.add_trace(
+    # Pull the years and yearly offsets out as arrays once, totalling before downcasting
+    years = environmental_data.index.year.to_numpy()
+    offset = environmental_data['Carbon Offset (Mt CO2)'].to_numpy()
+    cumulative = _f32(np.cumsum(offset))
+    offset = _f32(offset)
+    
+    # Yearly offset as bars with the running total as a line
+    traces = [
         go.Bar(
-            x=environmental_data.index.year,
-            y=environmental_data['Carbon Offset (Mt CO2)'],
+            x=years,
+            y=offset,
             name="Carbon Offset",
             marker_color='#27AE60'
-        )
-    )
-    
-    # Calculate cumulative offset
-    cumulative_offset = environmental_data['Carbon Offset (Mt CO2)'].cumsum()
-    
-    # Add line for cumulative offset
-    fig.add_trace(
+        ),
         go.Scatter(
-            x=environmental_data.index.year,
-            y=cumulative_offset,
+            x=years,
+            y=cumulative,
             name="Cumulative Offset",
             line=dict(color='#E31937', width=3),
             mode='lines+markers'
         )
-    )
+    ]
     
-    # Set figure layout
-    fig.update_layout(
+    layout = dict(
         title="Estimated Carbon Offset by Tesla Vehicles",
         template=theme,
         hovermode="x unified",
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        height=500
+        height=500,
+        xaxis=dict(title_text="Year"),
+        yaxis=dict(title_text="Million Metric Tons CO2")
     )
     
-    # Set axis titles
-    fig.update_xaxes(title_text="Year")
-    fig.update_yaxes(title_text="Million Metric Tons CO2")
-    
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
 def plot_energy_production(environmental_data, theme):
     """
@@ -818,48 +783,42 @@ def plot_energy_production(environmental_data, theme):
     Returns:
         Figure: Plotly figure object
     """
-    # Create figure with secondary y-axis
-    fig = make_subplots(specs=[[{"secondary_y": True}]])
+    # Pull the years and both series out as arrays once
+    years = environmental_data.index.year.to_numpy()
+    solar = _f32(environmental_data['Solar Deployment (MW)'].to_numpy())
+    storage = _f32(environmental_data['Energy Storage (MWh)'].to_numpy())
     
-    # Add solar deployment line
-    fig.add_trace(
+    # Solar on the left axis, storage on a second y-axis overlaid on the right
+    traces = [
         go.Scatter(
-            x=environmental_data.index.year,
-            y=environmental_data['Solar Deployment (MW)'],
+            x=years,
+            y=solar,
             name="Solar Deployment (MW)",
             line=dict(color='#F1C40F', width=2),
             mode='lines+markers'
         ),
-        secondary_y=False
-    )
-    
-    # Add energy storage line
-    fig.add_trace(
         go.Scatter(
-            x=environmental_data.index.year,
-            y=environmental_data['Energy Storage (MWh)'],
+            x=years,
+            y=storage,
             name="Energy Storage (MWh)",
+            yaxis='y2',
             line=dict(color='#3498DB', width=2),
             mode='lines+markers'
-        ),
-        secondary_y=True
-    )
+        )
+    ]
     
-    # Set figure layout
-    fig.update_layout(
+    layout = dict(
         title="Tesla Energy Production",
         template=theme,
         hovermode="x unified",
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-        height=500
+        height=500,
+        xaxis=dict(title_text="Year"),
+        yaxis=dict(title_text="Solar Deployment (MW)"),
+        yaxis2=dict(title_text="Energy Storage (MWh)", overlaying='y', side='right')
     )
     
-    # Set axis titles
-    fig.update_xaxes(title_text="Year")
-    fig.update_yaxes(title_text="Solar Deployment (MW)", secondary_y=False)
-    fig.update_yaxes(title_text="Energy Storage (MWh)", secondary_y=True)
-    
-    return fig
+    return go.Figure(data=traces, layout=layout)
 
 def plot_sustainability_radar(sustainability_data, theme):
     """
@@ -872,27 +831,27 @@ def plot_sustainability_radar(sustainability_data, theme):
     Returns:
         Figure: Plotly figure object
     """
+    # Key the cached figure on the metric pairs, which are hashable unlike the mapping
+    return go.Figure(_sustainability_radar_spec(tuple(sustainability_data.items()), theme))
+
+@functools.lru_cache(maxsize=64)
+def _sustainability_radar_spec(items, theme):
+    """Build the sustainability radar from (metric, value) pairs as a plain figure dict."""
     # Get metric categories and values
-    categories = list(sustainability_data.keys())
-    values = list(sustainability_data.values())
+    categories = [name for name, _ in items]
+    values = [value for _, value in items]
     
-    # Create radar chart
-    fig = go.Figure()
+    # Tesla against a sample industry average
+    industry_avg = [50, 40, 35, 30, 45, 30]  # Sample industry averages
     
-    fig.add_trace(
+    traces = [
         go.Scatterpolar(
             r=values,
             theta=categories,
             fill='toself',
             name='Tesla Sustainability',
             line=dict(color='#27AE60')
-        )
-    )
-    
-    # Add industry average for comparison
-    industry_avg = [50, 40, 35, 30, 45, 30]  # Sample industry averages
-    
-    fig.add_trace(
+        ),
         go.Scatterpolar(
             r=industry_avg,
             theta=categories,
@@ -900,10 +859,9 @@ def plot_sustainability_radar(sustainability_data, theme):
             name='Industry Average',
             line=dict(color='#95A5A6')
         )
-    )
+    ]
     
-    # Set figure layout
-    fig.update_layout(
+    layout = dict(
         title="Sustainability Performance (% of Target)",
         template=theme,
         polar=dict(
@@ -917,4 +875,4 @@ def plot_sustainability_radar(sustainability_data, theme):
         height=500
     )
     
-    return fig
+    return go.Figure(data=traces, layout=layout).to_dict()